@@ -0,0 +1,39 @@
+"""Typed result schemas for SENTINEL AEGIS assessment modules.
+
+Slotted, frozen dataclasses replace the loose per-module result dicts:
+attribute access is a fixed C-level offset lookup instead of a hash
+probe, instances are smaller, and the aggregation code gets a single
+shape to reason about.
+"""
+from dataclasses import dataclass, field, asdict
+
+
+@dataclass(slots=True, frozen=True)
+class Finding:
+    """A single issue reported by a module"""
+    name: str
+    severity: str = "info"
+    id: str | None = None
+    affected_systems: tuple = ()
+    remediation: str | None = None
+
+
+@dataclass(slots=True, frozen=True)
+class ModuleResult:
+    """Outcome of one module run.
+
+    Scored findings go in `findings`; anything module-specific
+    (framework scores, response metrics, threat intel) goes in
+    `details` and is passed through to the report unchanged.
+    """
+    status: str
+    risk_score: float | None = None
+    findings: tuple = ()
+    details: dict = field(default_factory=dict)
+
+
+def result_to_dict(result):
+    """JSON-ready dict view of a ModuleResult; plain dicts pass through"""
+    if isinstance(result, ModuleResult):
+        return asdict(result)
+    return result